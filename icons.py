@@ -0,0 +1,150 @@
+"""
+Shared Icon Rendering
+Arrow, charging bolt and warning icons used by both DGUS asset generators.
+
+Icons are cached per argument set, so callers get the same Image object
+back for repeated requests and must treat it as read-only (save/copy only).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:  # optional, PIL's polygon fill is used instead
+    cv2 = None
+
+Point = tuple[int, int]
+Color = tuple[int, ...]
+
+
+# ============================================================================
+# GEOMETRY
+# ============================================================================
+
+# Left-pointing arrows per canvas size; right arrows are mirrored
+ARROW_LEFT: dict[tuple[int, int], list[Point]] = {
+    (140, 100): [(100, 15), (30, 50), (100, 85), (100, 65), (130, 65), (130, 35), (100, 35)],
+    (120, 80): [(80, 10), (20, 40), (80, 70), (80, 55), (110, 55), (110, 25), (80, 25)],
+}
+
+# Charging bolts per canvas size
+BOLT: dict[tuple[int, int], list[Point]] = {
+    (100, 100): [(50, 10), (30, 50), (45, 50), (35, 90), (70, 45), (55, 45)],
+    (80, 80): [(40, 5), (20, 45), (35, 45), (25, 75), (60, 30), (45, 30)],
+}
+
+# Warning triangles per canvas size
+TRIANGLE: dict[tuple[int, int], list[Point]] = {
+    (100, 100): [(50, 10), (90, 90), (10, 90)],
+    (100, 90): [(50, 5), (5, 85), (95, 85)],
+}
+
+
+def arrow_points(direction: str, size: tuple[int, int]) -> list[Point]:
+    """Return arrow polygon for 'left' or 'right' on a canvas of size."""
+    points = ARROW_LEFT[size]
+    if direction == "left":
+        return points
+    return [(size[0] - x, y) for x, y in points]
+
+
+def _canvas(size: tuple[int, int], background: Color) -> Image.Image:
+    """Create an RGB or RGBA canvas depending on the background tuple."""
+    return Image.new("RGBA" if len(background) == 4 else "RGB", size, background)
+
+
+def _fill_polygon(img: Image.Image, points: list[Point], fill: Color) -> Image.Image:
+    """Fill a polygon, using OpenCV's vectorized scanline fill if available."""
+    if cv2 is None:
+        ImageDraw.Draw(img).polygon(points, fill=fill)
+        return img
+
+    buf = np.array(img)
+    if len(fill) < buf.shape[2]:
+        fill = tuple(fill) + (255,)
+    pts = np.array(points, np.int32).reshape(-1, 1, 2)
+    cv2.fillPoly(buf, [pts], fill)
+    return Image.fromarray(buf, img.mode)
+
+
+# ============================================================================
+# ICONS
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def arrow_icon(
+    direction: str,
+    fill: Color,
+    size: tuple[int, int],
+    background: Color = (0, 0, 0, 0),
+    outline: Color | None = None,
+) -> Image.Image:
+    """Create a turn indicator arrow."""
+    img = _canvas(size, background)
+    points = arrow_points(direction, size)
+    if outline is None:
+        return _fill_polygon(img, points, fill)
+    ImageDraw.Draw(img).polygon(points, fill=fill, outline=outline, width=2)
+    return img
+
+
+@lru_cache(maxsize=None)
+def bolt_icon(
+    fill: Color,
+    size: tuple[int, int],
+    background: Color = (0, 0, 0, 0),
+    ring: tuple[int, Color] | None = None,
+) -> Image.Image:
+    """Create a charging bolt, optionally inside a ring (inset, color)."""
+    img = _fill_polygon(_canvas(size, background), BOLT[size], fill)
+    if ring is not None:
+        inset, ring_color = ring
+        ImageDraw.Draw(img).ellipse(
+            (inset, inset, size[0] - inset, size[1] - inset),
+            outline=ring_color,
+            width=2
+        )
+    return img
+
+
+@lru_cache(maxsize=None)
+def triangle_icon(
+    fill: Color,
+    size: tuple[int, int],
+    background: Color = (0, 0, 0, 0),
+) -> Image.Image:
+    """Create a plain warning triangle."""
+    return _fill_polygon(_canvas(size, background), TRIANGLE[size], fill)
+
+
+@lru_cache(maxsize=None)
+def warning_badge(
+    shape: str,
+    color: Color,
+    symbol: str,
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    size: tuple[int, int] = (100, 100),
+    background: Color = (0, 0, 0, 255),
+) -> Image.Image:
+    """Create a translucent 'triangle' or circle badge with a symbol."""
+    img = _canvas(size, background)
+    fill = tuple(color[:3]) + (120,)
+
+    if shape == "triangle":
+        points = TRIANGLE[size]
+        img = _fill_polygon(img, points, fill)
+        draw = ImageDraw.Draw(img)
+        draw.line(points + [points[0]], fill=color, width=4)
+    else:
+        draw = ImageDraw.Draw(img)
+        draw.ellipse((10, 10, size[0] - 10, size[1] - 10), fill=fill, outline=color, width=4)
+
+    bbox = draw.textbbox((0, 0), symbol, font=font)
+    text_w = bbox[2] - bbox[0]
+    draw.text((size[0] // 2 - text_w // 2, 35), symbol, fill=color, font=font)
+    return img
@@ -1,56 +1,53 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 
-# Background color (RGB normalized)
-bg_color = (3/255, 6/255, 21/255)
+from raster import blend_into, centered_baseline, coverage, grow, to_px
+
+# Background color (RGB)
+bg_color = (3, 6, 21)
+YELLOW = (255, 255, 0)
+
+# Output geometry: same 984 px square the matplotlib version produced
+# (300 dpi, 0.1 in padding around the unit square)
+SIZE = 984
+PAD = 30
+SCALE = SIZE - 2 * PAD
+PT = 300 / 72  # pixels per point at 300 dpi
+
+try:
+    font_bang = ImageFont.truetype("DejaVuSans-Bold.ttf", round(90 * PT))
+except OSError:  # no DejaVu installed, Pillow's bundled font at the same size
+    font_bang = ImageFont.load_default(round(90 * PT))
+
+TRIANGLE = to_px([(0.5, 0.95), (0.05, 0.1), (0.95, 0.1)], PAD, SCALE)
 
 def draw_hazard(glow=False, filename="hazard.png"):
-    fig, ax = plt.subplots(figsize=(4, 4))
-    fig.patch.set_facecolor(bg_color)
-    ax.set_facecolor(bg_color)
+    buf = np.empty((SIZE, SIZE, 3), np.uint8)
+    buf[...] = bg_color
+    size = (SIZE, SIZE)
 
-    # Glow effect (draw multiple layers)
+    # Glow effect (draw multiple layers), polygons go through anti-aliased masks
     if glow:
+        # Clip to the unit square like the original axes did
+        box = buf[PAD:PAD + SCALE, PAD:PAD + SCALE]
         for lw, alpha in [(12, 0.15), (8, 0.25), (5, 0.4)]:
-            glow_triangle = patches.Polygon(
-                [[0.5, 0.95], [0.05, 0.1], [0.95, 0.1]],
-                closed=True,
-                edgecolor='yellow',
-                facecolor='none',
-                linewidth=lw,
-                alpha=alpha
-            )
-            ax.add_patch(glow_triangle)
+            # Stroke centred on the edge: outer offset minus inner offset
+            half = lw * PT / 2
+            outer = coverage(grow(TRIANGLE, half), size).astype(np.int16)
+            band = np.maximum(outer - coverage(grow(TRIANGLE, -half), size), 0)
+            blend_into(box, np.round(band[PAD:PAD + SCALE, PAD:PAD + SCALE] * alpha), YELLOW)
 
     # Main hazard triangle
-    triangle = patches.Polygon(
-        [[0.5, 0.95], [0.05, 0.1], [0.95, 0.1]],
-        closed=True,
-        edgecolor='yellow',
-        facecolor='yellow',
-        linewidth=3
-    )
-    ax.add_patch(triangle)
-
-    # Exclamation mark
-    ax.text(
-        0.5, 0.38, '!',
-        fontsize=90,
-        ha='center',
-        va='center',
-        color='black',
-        fontweight='bold'
-    )
-
-    # Formatting
-    ax.set_aspect('equal')
-    ax.axis('off')
-    plt.xlim(0, 1)
-    plt.ylim(0, 1)
+    blend_into(buf, coverage(grow(TRIANGLE, 3 * PT / 2), size), YELLOW)
+    img = Image.fromarray(buf).convert("RGBA")
+    draw = ImageDraw.Draw(img)
+
+    # Exclamation mark, vertically centred like matplotlib's va="center"
+    x, y = to_px([(0.5, 0.38)], PAD, SCALE)[0]
+    draw.text((x, centered_baseline(font_bang, y)), "!", fill="black", font=font_bang, anchor="ms")
 
     # Save image
-    plt.savefig(filename, dpi=300, bbox_inches='tight', facecolor=bg_color)
-    plt.close()
+    img.save(filename)
 
 # Generate images
 draw_hazard(glow=False, filename="Hazard_OFF.png")
@@ -0,0 +1,53 @@
+"""
+Shared Raster Helpers
+Alpha blending, polygon offsetting and anti-aliased polygon masks used by
+the NumPy/Pillow renderers (real2.py, turn.py and ii.py).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+Point = tuple[float, float]
+
+
+def to_px(points: list[Point], pad: float, scale: float) -> list[Point]:
+    """Map unit-square coordinates (y up) onto a padded square of scale pixels."""
+    return [(pad + x * scale, pad + (1 - y) * scale) for x, y in points]
+
+
+def grow(points: list[Point], d: float) -> list[Point]:
+    """Offset a polygon outward by d pixels (inward if negative), mitered corners."""
+    pts = np.asarray(points, float)
+    edges = np.roll(pts, -1, axis=0) - pts
+    # Right-hand edge normals point outward for a positive shoelace area
+    area = np.sum(pts[:, 0] * np.roll(pts[:, 1], -1) - np.roll(pts[:, 0], -1) * pts[:, 1])
+    normals = np.sign(area) * np.stack([edges[:, 1], -edges[:, 0]], axis=1)
+    normals /= np.hypot(normals[:, 0], normals[:, 1])[:, None]
+    before, after = np.roll(normals, 1, axis=0), normals
+    miter = (before + after) / (1 + np.sum(before * after, axis=1))[:, None]
+    return [tuple(p) for p in pts + d * miter]
+
+
+def coverage(points: list[Point], size: tuple[int, int], supersample: int = 4) -> np.ndarray:
+    """Anti-aliased uint8 mask of a filled polygon, box-filtered from a larger raster."""
+    big = Image.new("L", (size[0] * supersample, size[1] * supersample), 0)
+    ImageDraw.Draw(big).polygon(
+        [(x * supersample, y * supersample) for x, y in points], fill=255
+    )
+    return np.asarray(big.reduce(supersample))
+
+
+def blend_into(region: np.ndarray, alpha, color: tuple[int, ...]) -> None:
+    """Blend color into an RGB region through an alpha mask, rounding like ImageDraw."""
+    a = np.asarray(alpha, np.uint32)[..., None]
+    mix = region * (255 - a) + np.array(color, np.uint32) * a + 128
+    region[...] = ((mix >> 8) + mix) >> 8
+
+
+def centered_baseline(font: ImageFont.FreeTypeFont | ImageFont.ImageFont, y: float) -> float:
+    """Baseline that centres text on y by its "lp" line box, like matplotlib's va="center"."""
+    ascent = -font.getbbox("l", anchor="ls")[1]
+    descent = font.getbbox("p", anchor="ls")[3]
+    return y + (ascent - descent) / 2
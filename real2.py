@@ -1,12 +1,22 @@
 from PIL import Image, ImageDraw, ImageFont
-import os
+import numpy as np
 import math
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+
+from icons import arrow_icon, bolt_icon, warning_badge
+from raster import blend_into
 
 # ================= CONFIG =================
 WIDTH, HEIGHT = 200, 200
 BASE_DIR = "dgus_assets"
 SPEED_MAX = 80  # Define SPEED_MAX globally at the top
+FRAME_FORMAT = "PNG"  # or "BMP": uncompressed, much faster to encode
+                      # or "WEBP": lossless, cheap encode, convert to PNG before packaging
+LAYERED_OUTPUT = False  # save one static base image + small per-frame delta tiles
+ENCODE_THREADS = 2  # per worker, PIL releases the GIL while encoding
 
 folders = [
     "speed", "rpm",
@@ -14,9 +24,7 @@ folders = [
     "soc", "battery_vi", "motor_vi",
     "charging", "indicators", "warnings"
 ]
-
-for f in folders:
-    os.makedirs(os.path.join(BASE_DIR, f), exist_ok=True)
+DIRS = {name: Path(BASE_DIR) / name for name in folders}
 
 # Ensure console encoding supports UTF-8 (prevents emoji print errors on Windows)
 try:
@@ -45,6 +53,23 @@ try:
 except:
     font_big = font_med = font_small = ImageFont.load_default()
 
+# ================= GLYPH ATLAS =================
+def glyph_atlas(font, chars="0123456789%AV"):
+    """Rasterize each character once as an alpha tile"""
+    atlas = {}
+    for ch in chars:
+        x0, y0, x1, y1 = font.getbbox(ch)
+        tile = Image.new("L", (x1 - x0, y1 - y0), 0)
+        ImageDraw.Draw(tile).text((-x0, -y0), ch, fill=255, font=font)
+        atlas[ch] = (np.asarray(tile, dtype=np.uint32), x0, y0, int(font.getlength(ch)))
+    return atlas
+
+GLYPHS = {
+    "big": glyph_atlas(font_big),
+    "med": glyph_atlas(font_med),
+    "small": glyph_atlas(font_small),
+}
+
 # ================= HELPER FUNCTIONS =================
 def get_temp_color(temp, max_temp=80):
     """Dynamic color based on temperature"""
@@ -60,14 +85,190 @@ def draw_arc_gauge(draw, bounds, start_angle, end_angle, color, width=12):
     """Draw smooth arc"""
     draw.arc(bounds, start_angle, end_angle, fill=color, width=width)
 
+# Frame saves are queued on a thread pool so encoding overlaps rendering
+encoder = None
+pending_saves = []
+
+def queue_save(buf, stem):
+    """Queue an image buffer to be saved to stem + extension in FRAME_FORMAT"""
+    global encoder
+    img = Image.fromarray(buf)  # copies, so buf can be reused right away
+    if encoder is None:
+        encoder = ThreadPoolExecutor(max_workers=ENCODE_THREADS)
+    if FRAME_FORMAT == "BMP":
+        job = encoder.submit(img.save, stem.with_suffix(".bmp"), "BMP")
+    elif FRAME_FORMAT == "WEBP":
+        # Fastest lossless method, palettes the few flat colors per frame
+        job = encoder.submit(
+            img.save, stem.with_suffix(".webp"), "WEBP", lossless=True, method=0, quality=0
+        )
+    else:
+        # Fastest deflate level, frames are mostly flat color anyway
+        job = encoder.submit(img.save, stem.with_suffix(".png"), optimize=False, compress_level=1)
+    pending_saves.append(job)
+
+def save_frame(buf, stem):
+    """Queue a full frame, unless LAYERED_OUTPUT writes delta tiles instead"""
+    if not LAYERED_OUTPUT:
+        queue_save(buf, stem)
+
+def save_tile(buf, stem, box):
+    """With LAYERED_OUTPUT, queue the (x0, y0, x1, y1) box of buf as a delta tile
+
+    Tiles are saved in drawing order, so the folder's base image with each
+    frame's tiles pasted on top in that order reproduces the full frame.
+    """
+    if LAYERED_OUTPUT:
+        x0, y0, x1, y1 = box
+        queue_save(buf[y0:y1, x0:x1], stem)
+
+def flush_saves():
+    """Wait for queued saves (re-raising encoder errors) and stop the encoder"""
+    global encoder
+    for job in pending_saves:
+        job.result()
+    pending_saves.clear()
+    if encoder is not None:
+        encoder.shutdown()
+        encoder = None
+
+def render_batch(render, frames):
+    """Render a batch of frames in this worker and wait for them to be saved"""
+    for frame in frames:
+        render(frame)
+    flush_saves()
+
+def render_all(pool, render, frames, batch=8):
+    """Spread frames over the process pool in batches"""
+    frames = list(frames)
+    batches = [frames[i:i + batch] for i in range(0, len(frames), batch)]
+    list(pool.map(partial(render_batch, render), batches))
+
+def gauge_ticks(markers, full_scale):
+    """Precompute (x1, y1, x2, y2) endpoints of gauge marker lines"""
+    ticks = []
+    for marker in markers:
+        rad = math.radians(135 + (270 * marker / full_scale))
+        cos_r, sin_r = math.cos(rad), math.sin(rad)
+        ticks.append((100 + 75 * cos_r, 100 + 75 * sin_r,
+                      100 + 85 * cos_r, 100 + 85 * sin_r))
+    return ticks
+
+# ================= ARC LOOKUP TABLE =================
+# Ring pixels of the full 270 degree sweep and each pixel's angle along it,
+# so a frame's arc is a single comparison instead of a fresh rasterization
+ring = Image.new("L", (WIDTH, HEIGHT), 0)
+draw_arc_gauge(ImageDraw.Draw(ring), (20, 20, 180, 180), 135, 405, 255)
+ARC_RING = np.asarray(ring) > 0
+yy, xx = np.ogrid[:HEIGHT, :WIDTH]
+ARC_ANGLE = (np.degrees(np.arctan2(yy - 100, xx - 100)) - 135) % 360
+
+def arc_mask(sweep):
+    """Gauge arc pixels from 135 degrees through 135 + sweep"""
+    if sweep <= 0:
+        return np.zeros_like(ARC_RING)
+    return ARC_RING & (ARC_ANGLE <= sweep)
+
+def arc_masks(sweeps):
+    """Precompute the gauge arc for each sweep as a uint8 alpha mask (0/255)"""
+    return np.stack([arc_mask(sweep) for sweep in sweeps]).astype(np.uint8) * 255
+
+def compose_gauge(buf, base, arc, color, tick_mask):
+    """Copy base into buf, blend in the arc alpha mask and restamp the ticks"""
+    np.copyto(buf, base)
+    blend_into(buf, arc, color)
+    buf[tick_mask] = WHITE
+
+@lru_cache(maxsize=512)
+def text_width(text, font_id):
+    """Ink width of text laid out from the font's glyph atlas"""
+    atlas = GLYPHS[font_id]
+    x, left, right = 0, None, None
+    for ch in text:
+        alpha, ox, oy, advance = atlas[ch]
+        left = x + ox if left is None else min(left, x + ox)
+        right = x + ox + alpha.shape[1] if right is None else max(right, x + ox + alpha.shape[1])
+        x += advance
+    return right - left
+
+def mask_box(mask):
+    """Bounding box (x0, y0, x1, y1) of the nonzero pixels of a mask or mask stack"""
+    if mask.ndim == 3:
+        mask = mask.any(axis=0)
+    xs = np.flatnonzero(mask.any(axis=0))
+    ys = np.flatnonzero(mask.any(axis=1))
+    return int(xs[0]), int(ys[0]), int(xs[-1]) + 1, int(ys[-1]) + 1
+
+def text_box(labels, font_id, shape):
+    """Union ink box (x0, y0, x1, y1) of (xy, text) labels, clipped to a frame of this shape"""
+    atlas = GLYPHS[font_id]
+    x0 = y0 = math.inf
+    x1 = y1 = -math.inf
+    for (x, y), text in labels:
+        for ch in text:
+            alpha, ox, oy, advance = atlas[ch]
+            h, w = alpha.shape
+            x0, y0 = min(x0, x + ox), min(y0, y + oy)
+            x1, y1 = max(x1, x + ox + w), max(y1, y + oy + h)
+            x += advance
+    return max(0, x0), max(0, y0), min(x1, shape[1]), min(y1, shape[0])
+
+def blit_text(buf, xy, text, font_id, color):
+    """Alpha-blend cached glyph tiles into an RGB frame buffer"""
+    atlas = GLYPHS[font_id]
+    x, y = xy
+    height, width = buf.shape[:2]
+    for ch in text:
+        alpha, ox, oy, advance = atlas[ch]
+        top, left = y + oy, x + ox
+        h, w = alpha.shape
+        # Clip the tile to the frame
+        t0, l0 = max(0, -top), max(0, -left)
+        t1, l1 = min(h, height - top), min(w, width - left)
+        if t1 > t0 and l1 > l0:
+            region = buf[top + t0:top + t1, left + l0:left + l1]
+            blend_into(region, alpha[t0:t1, l0:l1], color)
+        x += advance
+
 # ================= SPEED GAUGE (0-80 km/h) =================
-print("Generating speed gauge...")
-for v in range(SPEED_MAX + 1):
-    img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-    d = ImageDraw.Draw(img)
-    
-    # Background circle
-    d.ellipse((10, 10, 190, 190), outline=GRAY, width=3)
+# Static layers (circle, markers, unit label) are rendered once
+base = Image.new("RGB", (WIDTH, HEIGHT), BG)
+d = ImageDraw.Draw(base)
+
+# Background circle
+d.ellipse((10, 10, 190, 190), outline=GRAY, width=3)
+
+# Speed markers (every 20 km/h), kept as a mask so they stay on top of the arc
+speed_ticks = Image.new("L", (WIDTH, HEIGHT), 0)
+td = ImageDraw.Draw(speed_ticks)
+for (x1, y1, x2, y2) in gauge_ticks([0, 20, 40, 60, SPEED_MAX], SPEED_MAX):
+    td.line([(x1, y1), (x2, y2)], fill=255, width=2)
+base.paste(WHITE, (0, 0), speed_ticks)
+
+# Unit label
+unit_bbox = d.textbbox((0, 0), "km/h", font=font_small)
+unit_w = unit_bbox[2] - unit_bbox[0]
+d.text((100 - unit_w//2, 125), "km/h", fill=GRAY, font=font_small)
+
+speed_base = np.asarray(base)
+speed_tick_mask = np.asarray(speed_ticks) > 0
+speed_buf = np.empty_like(speed_base)
+speed_arcs = arc_masks([int(270 * v / SPEED_MAX) for v in range(SPEED_MAX + 1)])
+
+def gauge_label(value):
+    """Centered big value text of a round gauge, as (xy, text)"""
+    text = str(value)
+    return (100 - text_width(text, "big")//2, 65), text
+
+# Delta tiles: arc ring (value text area inside it stays static) and the value text
+speed_tiles = {
+    "arc": mask_box(speed_arcs),
+    "value": text_box([gauge_label(v) for v in range(SPEED_MAX + 1)], "big", speed_base.shape),
+}
+
+def render_speed(v):
+    """Render and save one speed gauge frame"""
+    buf = speed_buf
     
     # Dynamic color based on speed
     if v < 40:
@@ -78,42 +279,47 @@ for v in range(SPEED_MAX + 1):
         color = RED
     
     # Arc progress
-    angle = int(270 * v / SPEED_MAX)
-    draw_arc_gauge(d, (20, 20, 180, 180), 135, 135 + angle, color)
-    
-    # Speed markers (every 20 km/h)
-    for marker in [0, 20, 40, 60, SPEED_MAX]:
-        marker_angle = 135 + (270 * marker / SPEED_MAX)
-        rad = math.radians(marker_angle)
-        x1 = 100 + 75 * math.cos(rad)
-        y1 = 100 + 75 * math.sin(rad)
-        x2 = 100 + 85 * math.cos(rad)
-        y2 = 100 + 85 * math.sin(rad)
-        d.line([(x1, y1), (x2, y2)], fill=WHITE, width=2)
+    compose_gauge(buf, speed_base, speed_arcs[v], color, speed_tick_mask)
+    save_tile(buf, DIRS["speed"] / f"arc_{v:03}", speed_tiles["arc"])
     
     # Center value
-    text = str(v)
-    bbox = d.textbbox((0, 0), text, font=font_big)
-    text_w = bbox[2] - bbox[0]
-    d.text((100 - text_w//2, 65), text, fill=WHITE, font=font_big)
+    xy, text = gauge_label(v)
+    blit_text(buf, xy, text, "big", WHITE)
+    save_tile(buf, DIRS["speed"] / f"value_{v:03}", speed_tiles["value"])
     
-    # Unit label
-    unit_bbox = d.textbbox((0, 0), "km/h", font=font_small)
-    unit_w = unit_bbox[2] - unit_bbox[0]
-    d.text((100 - unit_w//2, 125), "km/h", fill=GRAY, font=font_small)
-    
-    img.save(f"{BASE_DIR}/speed/{v:03}.png")
+    save_frame(buf, DIRS["speed"] / f"{v:03}")
 
 # ================= RPM GAUGE (0-8000, 17 frames) =================
-print("Generating RPM gauge...")
-for i in range(17):
-    img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-    d = ImageDraw.Draw(img)
+base = Image.new("RGB", (WIDTH, HEIGHT), BG)
+d = ImageDraw.Draw(base)
+
+# Background circle
+d.ellipse((10, 10, 190, 190), outline=GRAY, width=3)
+
+# RPM markers
+rpm_ticks = Image.new("L", (WIDTH, HEIGHT), 0)
+td = ImageDraw.Draw(rpm_ticks)
+for (x1, y1, x2, y2) in gauge_ticks(range(0, 9), 16):
+    td.line([(x1, y1), (x2, y2)], fill=255, width=2)
+base.paste(WHITE, (0, 0), rpm_ticks)
+
+# Unit label
+d.text((75, 125), "RPM", fill=GRAY, font=font_small)
+
+rpm_base = np.asarray(base)
+rpm_tick_mask = np.asarray(rpm_ticks) > 0
+rpm_buf = np.empty_like(rpm_base)
+rpm_arcs = arc_masks([int(270 * i / 16) for i in range(17)])
+rpm_tiles = {
+    "arc": mask_box(rpm_arcs),
+    "value": text_box([gauge_label(i * 500) for i in range(17)], "big", rpm_base.shape),
+}
+
+def render_rpm(i):
+    """Render and save one RPM gauge frame"""
+    buf = rpm_buf
     rpm_val = i * 500
     
-    # Background circle
-    d.ellipse((10, 10, 190, 190), outline=GRAY, width=3)
-    
     # Color based on RPM range
     if rpm_val < 4000:
         color = GREEN
@@ -123,75 +329,95 @@ for i in range(17):
         color = RED
     
     # Arc progress
-    angle = int(270 * i / 16)
-    draw_arc_gauge(d, (20, 20, 180, 180), 135, 135 + angle, color)
-    
-    # RPM markers
-    for marker in range(0, 9):
-        marker_angle = 135 + (270 * marker / 16)
-        rad = math.radians(marker_angle)
-        x1 = 100 + 75 * math.cos(rad)
-        y1 = 100 + 75 * math.sin(rad)
-        x2 = 100 + 85 * math.cos(rad)
-        y2 = 100 + 85 * math.sin(rad)
-        d.line([(x1, y1), (x2, y2)], fill=WHITE, width=2)
+    compose_gauge(buf, rpm_base, rpm_arcs[i], color, rpm_tick_mask)
+    save_tile(buf, DIRS["rpm"] / f"arc_{i:02}", rpm_tiles["arc"])
     
     # RPM value
-    text = str(rpm_val)
-    bbox = d.textbbox((0, 0), text, font=font_big)
-    text_w = bbox[2] - bbox[0]
-    d.text((100 - text_w//2, 65), text, fill=WHITE, font=font_big)
-    
-    # Unit label
-    d.text((75, 125), "RPM", fill=GRAY, font=font_small)
+    xy, text = gauge_label(rpm_val)
+    blit_text(buf, xy, text, "big", WHITE)
+    save_tile(buf, DIRS["rpm"] / f"value_{i:02}", rpm_tiles["value"])
     
-    img.save(f"{BASE_DIR}/rpm/{i:02}.png")
+    save_frame(buf, DIRS["rpm"] / f"{i:02}")
 
 # ================= TEMPERATURE BARS =================
-print("Generating temperature bars...")
-def temp_bar_enhanced(folder, label):
-    for t in range(101):
-        img = Image.new("RGB", (80, 220), BG)
-        d = ImageDraw.Draw(img)
-        
-        # Outer frame
-        d.rectangle((15, 15, 65, 205), outline=WHITE, width=3)
-        
-        # Temperature fill
-        base_y = 201
-        fill_h = int((t/100) * 175)
-        color = get_temp_color(t, 100)
-        top_y = base_y - fill_h
-        if fill_h > 0:
-            d.rectangle((19, top_y, 61, base_y), fill=color)
-
-        # Tick marks every 25%
-        for tick in [0.25, 0.5, 0.75]:
-            y = base_y - int(tick * 175)
-            d.line([(15, y), (22, y)], fill=GRAY, width=2)
-            d.line([(58, y), (65, y)], fill=GRAY, width=2)
-        
-        # Temperature value at bottom
-        temp_text = f"{t}"
-        bbox = d.textbbox((0, 0), temp_text, font=font_small)
-        text_w = bbox[2] - bbox[0]
-        d.text((40 - text_w//2, 208), temp_text, fill=WHITE, font=font_small)
-        
-        img.save(f"{BASE_DIR}/{folder}/{t:03}.png")
-
-temp_bar_enhanced("temp_motor", "Motor")
-temp_bar_enhanced("temp_controller", "Ctrl")
-temp_bar_enhanced("temp_battery", "Batt")
+# Outer frame and tick marks are prebaked into a template array
+template = Image.new("RGB", (80, 220), BG)
+d = ImageDraw.Draw(template)
+d.rectangle((15, 15, 65, 205), outline=WHITE, width=3)
 
-# ================= STATE OF CHARGE =================
-print("Generating SOC bar...")
-for s in range(101):
-    img = Image.new("RGB", (240, 80), BG)
-    d = ImageDraw.Draw(img)
+# Tick marks every 25%, drawn over the fill
+TEMP_BASE_Y = 201
+ticks = Image.new("1", (80, 220), 0)
+td = ImageDraw.Draw(ticks)
+for tick in [0.25, 0.5, 0.75]:
+    y = TEMP_BASE_Y - int(tick * 175)
+    td.line([(15, y), (22, y)], fill=1, width=2)
+    td.line([(58, y), (65, y)], fill=1, width=2)
+temp_tick_mask = np.asarray(ticks)
+
+temp_template = np.asarray(template).copy()
+temp_template[temp_tick_mask] = GRAY
+temp_buf = np.empty_like(temp_template)
+
+def temp_label(t):
+    """Temperature value text under the bar, as (xy, text)"""
+    text = f"{t}"
+    return (40 - text_width(text, "small")//2, 208), text
+
+# Delta tiles: fill column (full bar height) and the value text
+temp_tiles = {
+    "fill": (19, TEMP_BASE_Y - 175, 62, TEMP_BASE_Y + 1),
+    "value": text_box([temp_label(t) for t in range(101)], "small", temp_template.shape),
+}
+
+def render_temp(folder, t):
+    """Render and save one temperature bar frame"""
+    buf = temp_buf
+    np.copyto(buf, temp_template)
     
-    # Battery outline
-    d.rectangle((10, 20, 220, 60), outline=WHITE, width=4)
-    d.rectangle((220, 30, 230, 50), fill=WHITE)
+    # Temperature fill
+    fill_h = int((t/100) * 175)
+    color = get_temp_color(t, 100)
+    top_y = TEMP_BASE_Y - fill_h
+    if fill_h > 0:
+        buf[top_y:TEMP_BASE_Y + 1, 19:62] = color
+        buf[temp_tick_mask] = GRAY
+    save_tile(buf, DIRS[folder] / f"fill_{t:03}", temp_tiles["fill"])
+    
+    # Temperature value at bottom
+    xy, text = temp_label(t)
+    blit_text(buf, xy, text, "small", WHITE)
+    save_tile(buf, DIRS[folder] / f"value_{t:03}", temp_tiles["value"])
+    
+    save_frame(buf, DIRS[folder] / f"{t:03}")
+
+def temp_bar_enhanced(pool, folder, label):
+    render_all(pool, partial(render_temp, folder), range(101))
+
+# ================= STATE OF CHARGE =================
+# Battery outline
+soc_template = Image.new("RGB", (240, 80), BG)
+d = ImageDraw.Draw(soc_template)
+d.rectangle((10, 20, 220, 60), outline=WHITE, width=4)
+d.rectangle((220, 30, 230, 50), fill=WHITE)
+soc_template = np.asarray(soc_template)
+soc_buf = np.empty_like(soc_template)
+
+def soc_label(s):
+    """Percentage text centred on the battery, as (xy, text)"""
+    text = f"{s}%"
+    return (120 - text_width(text, "med")//2, 28), text
+
+# Delta tiles: fill bar and the percentage text drawn over it
+soc_tiles = {
+    "fill": (15, 25, 216, 56),
+    "value": text_box([soc_label(s) for s in range(101)], "med", soc_template.shape),
+}
+
+def render_soc(s):
+    """Render and save one state-of-charge frame"""
+    buf = soc_buf
+    np.copyto(buf, soc_template)
     
     # Fill color based on charge level
     if s > 60:
@@ -204,147 +430,162 @@ for s in range(101):
     # Fill bar
     fill_width = int((s/100) * 200)
     if fill_width > 0:
-        d.rectangle((15, 25, 15 + fill_width, 55), fill=fill_color)
+        buf[25:56, 15:16 + fill_width] = fill_color
+    save_tile(buf, DIRS["soc"] / f"fill_{s:03}", soc_tiles["fill"])
     
     # Percentage text
-    text = f"{s}%"
-    bbox = d.textbbox((0, 0), text, font=font_med)
-    text_w = bbox[2] - bbox[0]
+    xy, text = soc_label(s)
     text_color = BLACK if s > 30 else WHITE
-    d.text((120 - text_w//2, 28), text, fill=text_color, font=font_med)
+    blit_text(buf, xy, text, "med", text_color)
+    save_tile(buf, DIRS["soc"] / f"value_{s:03}", soc_tiles["value"])
     
-    img.save(f"{BASE_DIR}/soc/{s:03}.png")
+    save_frame(buf, DIRS["soc"] / f"{s:03}")
 
 # ================= VOLTAGE/CURRENT BARS =================
-print("Generating V/I bars...")
-def vi_bar_enhanced(folder, label, max_val, unit):
-    for v in range(max_val + 1):
-        img = Image.new("RGB", (240, 70), BG)
-        d = ImageDraw.Draw(img)
-        
-        # Bar background
-        d.rectangle((10, 30, 230, 60), outline=WHITE, width=3)
-        
-        # Fill
-        fill_width = int((v/max_val) * 210)
-        if fill_width > 0:
-            d.rectangle((13, 33, 13 + fill_width, 57), fill=BLUE)
-        
-        # Value text
-        text = f"{v}{unit}"
-        d.text((15, 5), text, fill=WHITE, font=font_small)
-        
-        img.save(f"{BASE_DIR}/{folder}/{v:03}.png")
-
-vi_bar_enhanced("battery_vi", "Battery", 100, "V")
-vi_bar_enhanced("motor_vi", "Motor", 150, "A")
+# Bar background
+vi_template = Image.new("RGB", (240, 70), BG)
+ImageDraw.Draw(vi_template).rectangle((10, 30, 230, 60), outline=WHITE, width=3)
+vi_template = np.asarray(vi_template)
+vi_buf = np.empty_like(vi_template)
+VI_FILL = (13, 33, 224, 58)  # fill bar delta tile, the value tile depends on the unit
+
+def render_vi(folder, max_val, unit, v):
+    """Render and save one voltage/current bar frame"""
+    buf = vi_buf
+    np.copyto(buf, vi_template)
+    
+    # Fill
+    fill_width = int((v/max_val) * 210)
+    if fill_width > 0:
+        buf[33:58, 13:14 + fill_width] = BLUE
+    save_tile(buf, DIRS[folder] / f"fill_{v:03}", VI_FILL)
+    
+    # Value text
+    text = f"{v}{unit}"
+    blit_text(buf, (15, 5), text, "small", WHITE)
+    save_tile(buf, DIRS[folder] / f"value_{v:03}", vi_value_tile(max_val, unit))
+    
+    save_frame(buf, DIRS[folder] / f"{v:03}")
+
+@lru_cache(maxsize=None)
+def vi_value_tile(max_val, unit):
+    """Delta tile covering every value text of a voltage/current bar"""
+    return text_box([((15, 5), f"{v}{unit}") for v in range(max_val + 1)], "small",
+                    vi_template.shape)
+
+def vi_bar_enhanced(pool, folder, label, max_val, unit):
+    render_all(pool, partial(render_vi, folder, max_val, unit), range(max_val + 1))
 
 # ================= CHARGING ICONS =================
-print("Generating charging icons...")
 def charging_icon_animated(charging=True):
     frames = []
     for frame in range(4):
-        img = Image.new("RGB", (100, 100), BG)
-        d = ImageDraw.Draw(img)
-        
         if charging:
-            bolt = [(50, 10), (30, 50), (45, 50), (35, 90), (70, 45), (55, 45)]
-            d.polygon(bolt, fill=GREEN if frame % 2 == 0 else (0, 180, 100))
-            d.ellipse((10 + frame*2, 10 + frame*2, 90 - frame*2, 90 - frame*2), 
-                     outline=GREEN, width=2)
+            fill = GREEN if frame % 2 == 0 else (0, 180, 100)
+            frames.append(bolt_icon(fill, (100, 100), BG, ring=(10 + frame*2, GREEN)))
         else:
-            bolt = [(50, 10), (30, 50), (45, 50), (35, 90), (70, 45), (55, 45)]
-            d.polygon(bolt, fill=RED)
-        
-        frames.append(img)
+            frames.append(bolt_icon(RED, (100, 100), BG))
     return frames
 
-charging_frames = charging_icon_animated(True)
-for i, frame in enumerate(charging_frames):
-    frame.save(f"{BASE_DIR}/charging/charging_{i}.png")
-
-discharging_frames = charging_icon_animated(False)
-discharging_frames[0].save(f"{BASE_DIR}/charging/discharging.png")
-
 # ================= TURN INDICATORS =================
-print("Generating turn indicators...")
 def indicator_animated(direction, frames=3):
     images = []
     for frame in range(frames):
-        img = Image.new("RGB", (140, 100), BG)
-        d = ImageDraw.Draw(img)
-        
         brightness = int(255 * (0.3 + 0.7 * (frame / (frames-1))))
         col = (0, brightness, int(brightness * 0.6))
-        
-        if direction == "left":
-            pts = [(100, 15), (30, 50), (100, 85), (100, 65), (130, 65), (130, 35), (100, 35)]
-        else:
-            pts = [(40, 15), (110, 50), (40, 85), (40, 65), (10, 65), (10, 35), (40, 35)]
-        
-        d.polygon(pts, fill=col, outline=WHITE, width=2)
-        images.append(img)
+        images.append(arrow_icon(direction, col, (140, 100), BG, outline=WHITE))
     return images
 
-left_frames = indicator_animated("left")
-for i, frame in enumerate(left_frames):
-    frame.save(f"{BASE_DIR}/indicators/left_{i}.png")
+# ================= WARNING ICONS =================
+warnings = {
+    "battery_low": ("triangle", RED, "!"),
+    "overheat": ("triangle", RED, "H"),
+    "motor_fault": ("circle", ORANGE, "M"),
+    "brake": ("circle", RED, "B"),
+    "abs": ("circle", YELLOW, "ABS")
+}
 
-right_frames = indicator_animated("right")
-for i, frame in enumerate(right_frames):
-    frame.save(f"{BASE_DIR}/indicators/right_{i}.png")
+# ================= GENERATION =================
+# Guarded so worker processes only import the render functions above
+if __name__ == "__main__":
+    for folder_path in DIRS.values():
+        folder_path.mkdir(parents=True, exist_ok=True)
 
-# Off states
-left_off = Image.new("RGB", (140, 100), BG)
-d = ImageDraw.Draw(left_off)
-pts = [(100, 15), (30, 50), (100, 85), (100, 65), (130, 65), (130, 35), (100, 35)]
-d.polygon(pts, fill=GRAY, outline=WHITE, width=2)
-left_off.save(f"{BASE_DIR}/indicators/left_off.png")
+    if LAYERED_OUTPUT:
+        layers = [
+            ("speed", speed_base, speed_tiles),
+            ("rpm", rpm_base, rpm_tiles),
+            ("temp_motor", temp_template, temp_tiles),
+            ("temp_controller", temp_template, temp_tiles),
+            ("temp_battery", temp_template, temp_tiles),
+            ("soc", soc_template, soc_tiles),
+            ("battery_vi", vi_template, {"fill": VI_FILL, "value": vi_value_tile(100, "V")}),
+            ("motor_vi", vi_template, {"fill": VI_FILL, "value": vi_value_tile(150, "A")}),
+        ]
+        base_name = f"base.{FRAME_FORMAT.lower()}"
+        print(f"Layered output: frames are delta tiles over {base_name}, pasted in this order")
+        for folder, base_img, tiles in layers:
+            queue_save(base_img, DIRS[folder] / "base")
+            for name, (x0, y0, x1, y1) in tiles.items():
+                print(f"  - {folder}/{name}_*: {x1 - x0}x{y1 - y0} at ({x0}, {y0})")
+        flush_saves()
 
-right_off = Image.new("RGB", (140, 100), BG)
-d = ImageDraw.Draw(right_off)
-pts = [(40, 15), (110, 50), (40, 85), (40, 65), (10, 65), (10, 35), (40, 35)]
-d.polygon(pts, fill=GRAY, outline=WHITE, width=2)
-right_off.save(f"{BASE_DIR}/indicators/right_off.png")
+    # Every frame is independent, so gauges and bars are rendered in parallel
+    with ProcessPoolExecutor() as pool:
+        print("Generating speed gauge...")
+        render_all(pool, render_speed, range(SPEED_MAX + 1))
 
-# ================= WARNING ICONS =================
-print("Generating warning icons...")
-warnings = {
-    "battery_low": (RED, "!"),
-    "overheat": (RED, "H"),
-    "motor_fault": (ORANGE, "M"),
-    "brake": (RED, "B"),
-    "abs": (YELLOW, "ABS")
-}
+        print("Generating RPM gauge...")
+        render_all(pool, render_rpm, range(17))
 
-for name, (color, symbol) in warnings.items():
-    img = Image.new("RGBA", (100, 100), BG + (255,))
-    d = ImageDraw.Draw(img)
+        print("Generating temperature bars...")
+        temp_bar_enhanced(pool, "temp_motor", "Motor")
+        temp_bar_enhanced(pool, "temp_controller", "Ctrl")
+        temp_bar_enhanced(pool, "temp_battery", "Batt")
 
-    if name in ["battery_low", "overheat"]:
-        pts = [(50, 10), (90, 90), (10, 90)]
-        fill_col = (color[0], color[1], color[2], 120)
-        d.polygon(pts, fill=fill_col)
-        d.line(pts + [pts[0]], fill=color, width=4)
-    else:
-        fill_col = (color[0], color[1], color[2], 120)
-        d.ellipse((10, 10, 90, 90), fill=fill_col, outline=color, width=4)
-
-    bbox = d.textbbox((0, 0), symbol, font=font_big)
-    text_w = bbox[2] - bbox[0]
-    d.text((50 - text_w//2, 35), symbol, fill=color, font=font_big)
-    img.save(f"{BASE_DIR}/warnings/{name}.png")
-
-print(f"\nALL DGUS ASSETS GENERATED SUCCESSFULLY")
-print(f"Output directory: {BASE_DIR}/")
-print(f"Total folders: {len(folders)}")
-print("\nGenerated assets:")
-print(f"  - Speed: {SPEED_MAX + 1} frames (0-{SPEED_MAX} km/h)")
-print(f"  - RPM: 17 frames (0-8000 RPM)")
-print(f"  - Temperatures: 101 frames each (0-100 C)")
-print(f"  - SOC: 101 frames (0-100%)")
-print(f"  - Battery V/I: 101 frames")
-print(f"  - Motor V/I: 151 frames")
-print(f"  - Charging: 4 animated frames + 1 static")
-print(f"  - Indicators: 3 animated frames each + off states")
-print(f"  - Warnings: {len(warnings)} icons")
\ No newline at end of file
+        print("Generating SOC bar...")
+        render_all(pool, render_soc, range(101))
+
+        print("Generating V/I bars...")
+        vi_bar_enhanced(pool, "battery_vi", "Battery", 100, "V")
+        vi_bar_enhanced(pool, "motor_vi", "Motor", 150, "A")
+
+    print("Generating charging icons...")
+    charging_frames = charging_icon_animated(True)
+    for i, frame in enumerate(charging_frames):
+        frame.save(DIRS["charging"] / f"charging_{i}.png")
+
+    discharging_frames = charging_icon_animated(False)
+    discharging_frames[0].save(DIRS["charging"] / "discharging.png")
+
+    print("Generating turn indicators...")
+    left_frames = indicator_animated("left")
+    for i, frame in enumerate(left_frames):
+        frame.save(DIRS["indicators"] / f"left_{i}.png")
+
+    right_frames = indicator_animated("right")
+    for i, frame in enumerate(right_frames):
+        frame.save(DIRS["indicators"] / f"right_{i}.png")
+
+    # Off states
+    arrow_icon("left", GRAY, (140, 100), BG, outline=WHITE).save(DIRS["indicators"] / "left_off.png")
+    arrow_icon("right", GRAY, (140, 100), BG, outline=WHITE).save(DIRS["indicators"] / "right_off.png")
+
+    print("Generating warning icons...")
+    for name, (shape, color, symbol) in warnings.items():
+        img = warning_badge(shape, color, symbol, font_big, (100, 100), BG + (255,))
+        img.save(DIRS["warnings"] / f"{name}.png")
+
+    print(f"\nALL DGUS ASSETS GENERATED SUCCESSFULLY")
+    print(f"Output directory: {BASE_DIR}/")
+    print(f"Total folders: {len(folders)}")
+    print("\nGenerated assets:")
+    print(f"  - Speed: {SPEED_MAX + 1} frames (0-{SPEED_MAX} km/h)")
+    print(f"  - RPM: 17 frames (0-8000 RPM)")
+    print(f"  - Temperatures: 101 frames each (0-100 C)")
+    print(f"  - SOC: 101 frames (0-100%)")
+    print(f"  - Battery V/I: 101 frames")
+    print(f"  - Motor V/I: 151 frames")
+    print(f"  - Charging: 4 animated frames + 1 static")
+    print(f"  - Indicators: 3 animated frames each + off states")
+    print(f"  - Warnings: {len(warnings)} icons")
@@ -13,6 +13,8 @@ from typing import NamedTuple
 
 from PIL import Image, ImageDraw, ImageFont
 
+from icons import arrow_icon, bolt_icon, triangle_icon
+
 # Fix Unicode output on Windows
 if sys.platform == "win32":
     try:
@@ -53,7 +55,11 @@ class Config:
 # ============================================================================
 
 class Color(NamedTuple):
-    """RGB or RGBA color tuple."""
+    """RGBA color tuple.
+
+    Pillow takes a Color as-is as the ink for both RGB and RGBA images,
+    so draw calls pass it directly instead of building new tuples.
+    """
     r: int
     g: int
     b: int
@@ -128,6 +134,9 @@ class AssetGenerator:
     def __init__(self, config: Config = Config()):
         """Initialize generator with configuration."""
         self.config = config
+        self.dirs = {
+            folder: config.OUTPUT_DIR / folder for folder in config.FOLDERS
+        }
         self.font_big: ImageFont.FreeTypeFont | ImageFont.ImageFont
         self.font_med: ImageFont.FreeTypeFont | ImageFont.ImageFont
         
@@ -140,8 +149,8 @@ class AssetGenerator:
     
     def _create_directories(self) -> None:
         """Create output directory structure."""
-        for folder in self.config.FOLDERS:
-            (self.config.OUTPUT_DIR / folder).mkdir(parents=True, exist_ok=True)
+        for folder_path in self.dirs.values():
+            folder_path.mkdir(parents=True, exist_ok=True)
         print(f"[OK] Created {len(self.config.FOLDERS)} output directories")
     
     def _load_fonts(self) -> None:
@@ -169,7 +178,7 @@ class AssetGenerator:
         img = Image.new(
             "RGB", 
             (self.config.CANVAS_WIDTH, self.config.CANVAS_HEIGHT), 
-            Palette.BG.as_rgb()
+            Palette.BG
         )
         draw = ImageDraw.Draw(img)
         
@@ -184,7 +193,7 @@ class AssetGenerator:
             draw.rounded_rectangle(
                 coords, 
                 radius, 
-                outline=color.as_rgb(), 
+                outline=color, 
                 width=width
             )
         
@@ -198,10 +207,10 @@ class AssetGenerator:
             draw.rounded_rectangle(
                 coords, 
                 radius, 
-                fill=fill_color.as_rgb()
+                fill=fill_color
             )
         
-        output_path = self.config.OUTPUT_DIR / "background" / "dashboard_bg.png"
+        output_path = self.dirs["background"] / "dashboard_bg.png"
         img.save(output_path)
         print("✓ Background generated")
     
@@ -228,11 +237,11 @@ class AssetGenerator:
     
     def _create_label(self, spec: LabelSpec) -> None:
         """Create individual label image."""
-        img = Image.new("RGBA", (260, 50), Palette.TRANSPARENT.as_rgba())
+        img = Image.new("RGBA", (260, 50), Palette.TRANSPARENT)
         draw = ImageDraw.Draw(img)
-        draw.text((10, 5), spec.text, fill=Palette.DARK.as_rgb(), font=self.font_med)
+        draw.text((10, 5), spec.text, fill=Palette.DARK, font=self.font_med)
         
-        output_path = self.config.OUTPUT_DIR / "labels" / spec.filename
+        output_path = self.dirs["labels"] / spec.filename
         img.save(output_path)
     
     # ========================================================================
@@ -250,26 +259,20 @@ class AssetGenerator:
         
         for spec in arrows:
             img = self._create_arrow(spec.direction, spec.state)
-            output_path = self.config.OUTPUT_DIR / "indicators" / f"{spec.name}.png"
+            output_path = self.dirs["indicators"] / f"{spec.name}.png"
             img.save(output_path)
         
         print(f"✓ Generated {len(arrows)} arrow indicators")
     
     def _create_arrow(self, direction: Direction, state: State) -> Image.Image:
         """Create arrow indicator icon."""
-        img = Image.new("RGBA", (120, 80), Palette.TRANSPARENT.as_rgba())
-        draw = ImageDraw.Draw(img)
-        
         color = Palette.GREEN if state == State.ON else Palette.GRAY
-        
-        points = (
-            [(80, 10), (20, 40), (80, 70), (80, 55), (110, 55), (110, 25), (80, 25)]
-            if direction == Direction.LEFT else
-            [(40, 10), (100, 40), (40, 70), (40, 55), (10, 55), (10, 25), (40, 25)]
+        return arrow_icon(
+            direction.value,
+            color,
+            (120, 80),
+            Palette.TRANSPARENT
         )
-        
-        draw.polygon(points, fill=color.as_rgb())
-        return img
     
     # ========================================================================
     # WARNINGS
@@ -280,21 +283,19 @@ class AssetGenerator:
         for state in [State.OFF, State.ON]:
             img = self._create_warning(state)
             filename = f"warning_{'on' if state == State.ON else 'off'}.png"
-            output_path = self.config.OUTPUT_DIR / "warning" / filename
+            output_path = self.dirs["warning"] / filename
             img.save(output_path)
         
         print("✓ Generated warning icons")
     
     def _create_warning(self, state: State) -> Image.Image:
         """Create warning triangle icon."""
-        img = Image.new("RGBA", (100, 90), Palette.TRANSPARENT.as_rgba())
-        draw = ImageDraw.Draw(img)
-        
         color = Palette.RED if state == State.ON else Palette.GRAY
-        points = [(50, 5), (5, 85), (95, 85)]
-        draw.polygon(points, fill=color.as_rgb())
-        
-        return img
+        return triangle_icon(
+            color,
+            (100, 90),
+            Palette.TRANSPARENT
+        )
     
     # ========================================================================
     # BARS
@@ -309,29 +310,29 @@ class AssetGenerator:
     def _create_temp_bars(self) -> None:
         """Create temperature bar indicators."""
         for filled in [False, True]:
-            img = Image.new("RGBA", (50, 200), Palette.TRANSPARENT.as_rgba())
+            img = Image.new("RGBA", (50, 200), Palette.TRANSPARENT)
             draw = ImageDraw.Draw(img)
-            draw.rectangle((0, 0, 50, 200), outline=Palette.DARK.as_rgb(), width=3)
+            draw.rectangle((0, 0, 50, 200), outline=Palette.DARK, width=3)
             
             if filled:
-                draw.rectangle((3, 90, 47, 197), fill=Palette.YELLOW.as_rgb())
+                draw.rectangle((3, 90, 47, 197), fill=Palette.YELLOW)
             
             filename = f"temp_bar_{'fill' if filled else 'empty'}.png"
-            output_path = self.config.OUTPUT_DIR / "bars" / filename
+            output_path = self.dirs["bars"] / filename
             img.save(output_path)
     
     def _create_soc_bars(self) -> None:
         """Create state-of-charge bar indicators."""
         for filled in [False, True]:
-            img = Image.new("RGBA", (200, 40), Palette.TRANSPARENT.as_rgba())
+            img = Image.new("RGBA", (200, 40), Palette.TRANSPARENT)
             draw = ImageDraw.Draw(img)
-            draw.rectangle((0, 0, 200, 40), outline=Palette.DARK.as_rgb(), width=3)
+            draw.rectangle((0, 0, 200, 40), outline=Palette.DARK, width=3)
             
             if filled:
-                draw.rectangle((3, 3, 160, 37), fill=Palette.GREEN.as_rgb())
+                draw.rectangle((3, 3, 160, 37), fill=Palette.GREEN)
             
             filename = f"soc_bar_{'fill' if filled else 'empty'}.png"
-            output_path = self.config.OUTPUT_DIR / "bars" / filename
+            output_path = self.dirs["bars"] / filename
             img.save(output_path)
     
     # ========================================================================
@@ -343,21 +344,19 @@ class AssetGenerator:
         for is_charging in [True, False]:
             img = self._create_charging_icon(is_charging)
             filename = f"{'charging' if is_charging else 'discharging'}.png"
-            output_path = self.config.OUTPUT_DIR / "charging" / filename
+            output_path = self.dirs["charging"] / filename
             img.save(output_path)
         
         print("✓ Generated charging icons")
     
     def _create_charging_icon(self, charging: bool) -> Image.Image:
         """Create charging bolt icon."""
-        img = Image.new("RGBA", (80, 80), Palette.TRANSPARENT.as_rgba())
-        draw = ImageDraw.Draw(img)
-        
         color = Palette.GREEN if charging else Palette.RED
-        points = [(40, 5), (20, 45), (35, 45), (25, 75), (60, 30), (45, 30)]
-        draw.polygon(points, fill=color.as_rgb())
-        
-        return img
+        return bolt_icon(
+            color,
+            (80, 80),
+            Palette.TRANSPARENT
+        )
     
     # ========================================================================
     # MAIN GENERATION
@@ -1,90 +1,128 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from functools import lru_cache
+
 import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from raster import blend_into, centered_baseline, coverage, grow, to_px
 
 # Background color (RGB 3,6,21)
-BG = (3/255, 6/255, 21/255)
+BG = (3, 6, 21)
+# Body fills have the old 8% white "3D shine" premixed: #00FF66 and #1f6f4a
+BODY_ON = (20, 255, 114)
+BODY_OFF = (49, 122, 88)
+EDGE = (0, 255, 153)  # #00FF99
+TEXT_ON = (0, 0, 0)
+TEXT_OFF = (10, 42, 30)  # #0a2a1e
+
+# Arrow points, the right arrow is the left one mirrored about x = 0.5
+ARROW_LEFT = np.array([
+    [0.15, 0.5],
+    [0.45, 0.85],
+    [0.45, 0.65],
+    [0.85, 0.65],
+    [0.85, 0.35],
+    [0.45, 0.35],
+    [0.45, 0.15],
+])
+ARROWS = {
+    "left": ARROW_LEFT,
+    "right": ARROW_LEFT * [-1, 1] + [1, 0],
+}
+
+# Output geometry: same square the matplotlib version produced (1.54 in
+# unit square plus 0.1 in padding, 522 px at 300 dpi)
+DPI = 300  # keeps the existing asset size, set to 150 for a quarter of the pixels
+SIZE = round(1.74 * DPI)
+PAD = round(0.1 * DPI)
+SCALE = SIZE - 2 * PAD
+PT = DPI / 72  # pixels per point
+SUPERSAMPLE = 4  # polygons are drawn this much larger and averaged down
+PALETTE_COLORS = 256  # quantize to a paletted PNG, None keeps full RGB
+
+# Glow layers as (width in points, alpha), soft halos around the arrow body
+GLOW_COLOR = (0, 255, 102)  # #00FF66
+GLOW_LAYERS = [(18, 0.12), (12, 0.25), (6, 0.45)]
+
+# Plain backdrop, and the one frame buffer every render is composed in
+BACKGROUND = np.full((SIZE, SIZE, 3), BG, np.uint8)
+frame = np.empty_like(BACKGROUND)
+
+try:
+    font_thor = ImageFont.truetype("DejaVuSans-Bold.ttf", round(22 * PT))
+except OSError:  # no DejaVu installed, Pillow's bundled font at the same size
+    font_thor = ImageFont.load_default(round(22 * PT))
+
+def compose_arrow(img, body, edge, text, body_color, text_color):
+    """Blend the body, edge and label masks into img in drawing order"""
+    blend_into(img, body, body_color)
+    blend_into(img, edge, EDGE)
+    blend_into(img, text, text_color)
+
+@lru_cache(maxsize=None)
+def _glow_image(direction):
+    """Background with the glow composited in, as an RGB frame"""
+    if direction == "right":
+        return np.fliplr(_glow_image("left"))
+    points = to_px(ARROWS[direction], PAD, SCALE)
+
+    img = BACKGROUND.copy()
+    for lw, alpha in GLOW_LAYERS:
+        # Silhouette grown by half the stroke width, then feathered
+        width = lw * PT
+        silhouette = Image.new("L", (SIZE, SIZE), 0)
+        ImageDraw.Draw(silhouette).polygon(grow(points, width / 2), fill=255)
+        soft = silhouette.filter(ImageFilter.GaussianBlur(width / 8))
+        blend_into(img, np.round(np.asarray(soft) * alpha), GLOW_COLOR)
+    return img
+
+@lru_cache(maxsize=None)
+def _arrow_masks(direction):
+    """Body and edge coverage masks, rasterized once for both directions"""
+    if direction == "right":
+        # The frame is symmetric about its centre column, so mirror the left masks
+        return tuple(np.fliplr(mask) for mask in _arrow_masks("left"))
+    body = to_px(ARROWS[direction], PAD, SCALE)
+    size = (SIZE, SIZE)
+    # 2 pt edge stroke centred on the outline, as the band between two offsets
+    outer = coverage(grow(body, PT), size, SUPERSAMPLE).astype(np.int16)
+    edge = np.maximum(outer - coverage(grow(body, -PT), size, SUPERSAMPLE), 0).astype(np.uint8)
+    return coverage(body, size, SUPERSAMPLE), edge
+
+@lru_cache(maxsize=None)
+def _text_mask():
+    """Rasterize "THOR" once as a coverage mask"""
+    mask = Image.new("L", (SIZE, SIZE), 0)
+    x, y = to_px([(0.5, 0.5)], PAD, SCALE)[0]
+    ImageDraw.Draw(mask).text((x, centered_baseline(font_thor, y)), "THOR", fill=255, font=font_thor, anchor="ms")
+    return np.asarray(mask)
 
 def draw_turn(direction="left", glow=False, filename="turn.png"):
-    fig, ax = plt.subplots(figsize=(4, 2))
-    fig.patch.set_facecolor(BG)
-    ax.set_facecolor(BG)
-
-    # Arrow points
-    if direction == "left":
-        arrow = np.array([
-            [0.15, 0.5],
-            [0.45, 0.85],
-            [0.45, 0.65],
-            [0.85, 0.65],
-            [0.85, 0.35],
-            [0.45, 0.35],
-            [0.45, 0.15],
-        ])
-    else:
-        arrow = np.array([
-            [0.85, 0.5],
-            [0.55, 0.85],
-            [0.55, 0.65],
-            [0.15, 0.65],
-            [0.15, 0.35],
-            [0.55, 0.35],
-            [0.55, 0.15],
-        ])
-
-    # Glow layers
-    if glow:
-        for lw, alpha in [(18, 0.12), (12, 0.25), (6, 0.45)]:
-            ax.add_patch(
-                patches.Polygon(
-                    arrow,
-                    closed=True,
-                    edgecolor="#00FF66",
-                    facecolor="none",
-                    linewidth=lw,
-                    alpha=alpha
-                )
-            )
-
-    # Main arrow body (3D effect)
-    arrow_body = patches.Polygon(
-        arrow,
-        closed=True,
-        facecolor="#00FF66" if glow else "#1f6f4a",
-        edgecolor="#00FF99",
-        linewidth=2
-    )
-    ax.add_patch(arrow_body)
-
-    # Highlight (fake 3D shine)
-    highlight = patches.Polygon(
-        arrow * [1, 0.92] + [0, 0.04],
-        closed=True,
-        facecolor="white",
-        alpha=0.08
-    )
-    ax.add_patch(highlight)
-
-    # THOR text
-    ax.text(
-        0.5, 0.5, "THOR",
-        color="black" if glow else "#0a2a1e",
-        fontsize=22,
-        fontweight="bold",
-        ha="center",
-        va="center"
-    )
-
-    ax.set_aspect("equal")
-    ax.axis("off")
-    plt.xlim(0, 1)
-    plt.ylim(0, 1)
-
-    plt.savefig(filename, dpi=300, bbox_inches="tight", facecolor=BG)
-    plt.close()
-
-# Generate images
-draw_turn("left",  glow=True,  filename="left_on.png")
-draw_turn("left",  glow=False, filename="left_off.png")
-draw_turn("right", glow=True,  filename="right_on.png")
-draw_turn("right", glow=False, filename="right_off.png")
+    # Glow layers, blurred once per direction and used as the backdrop
+    np.copyto(frame, _glow_image(direction) if glow else BACKGROUND)
+
+    # Main arrow body (3D effect) and text
+    body, edge = _arrow_masks(direction)
+    compose_arrow(frame, body, edge, _text_mask(),
+                  BODY_ON if glow else BODY_OFF, TEXT_ON if glow else TEXT_OFF)
+
+    # Fastest deflate level below, flat-color art barely compresses better
+    img = Image.fromarray(frame)
+    if PALETTE_COLORS is None:
+        img.save(filename, optimize=False, compress_level=1)
+        return
+
+    # Flat UI colors plus anti-aliasing fit a small palette almost losslessly
+    img.quantize(PALETTE_COLORS).save(filename, optimize=False, compress_level=1)
+
+# (direction, glow, filename) for every image
+TURNS = [
+    ("left",  True,  "left_on.png"),
+    ("left",  False, "left_off.png"),
+    ("right", True,  "right_on.png"),
+    ("right", False, "right_off.png"),
+]
+
+if __name__ == "__main__":
+    # Generate images in-process, so all four share the cached masks
+    for direction, glow, filename in TURNS:
+        draw_turn(direction, glow, filename)